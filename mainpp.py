@@ -1,4 +1,8 @@
 import os
+import io
+import csv
+import zlib
+import tempfile
 import asyncio
 import json
 import requests
@@ -14,6 +18,11 @@ BOT_TOKEN = "PUt_YOUR_DISCORD_BOT_TOKEN_HERE"
 WARERA_TOKEN = "Put_YOUR_WARERA_API_TOKEN_HERE"
 COUNTRY_ID = "Put_your_country_id_here"
 DB_FILE = "tax_bot.db"
+EXPORT_CHUNK_ROWS = 500
+EXPORT_DEFAULT_UPLOAD_LIMIT = 10 * 1024 * 1024  # Discord's default upload cap
+EXPORT_MAX_FILES_PER_MESSAGE = 10
+EXPORT_GZIP_TRAILER_BYTES = 16  # final empty deflate block + gzip CRC/size trailer, with headroom
+EXPORT_TABLES = ("players", "tax_rules", "tax_settings")
 
 intents = discord.Intents.default()
 intents.message_content = True
@@ -153,6 +162,88 @@ def find_player_in_db_by_name(warera_name: str):
     conn.close()
     return row
 
+# ================= EXPORT (streamed, gzip, chunked) =================
+def _encode_export_rows(columns, rows, fmt):
+    buf = io.StringIO()
+    if fmt == "csv":
+        csv.writer(buf).writerows(rows)
+    else:
+        for row in rows:
+            buf.write(json.dumps(dict(zip(columns, row)), ensure_ascii=False))
+            buf.write("\n")
+    return buf.getvalue().encode("utf-8")
+
+def _new_export_part(header):
+    comp = zlib.compressobj(wbits=31)  # gzip container
+    part = bytearray(comp.compress(header) + comp.flush(zlib.Z_SYNC_FLUSH))
+    return comp, part
+
+def iter_export_parts(table, fmt, max_bytes):
+    """Yield gzip-compressed parts of `table`, each a standalone file of at most max_bytes.
+
+    Rows are pulled from a SQLite cursor EXPORT_CHUNK_ROWS at a time and
+    compressed as they arrive, so only one part is ever held in memory.
+    A chunk that does not fit in the current part is retried in a fresh
+    part, halving it down to single rows if needed. An empty table still
+    yields one part (just the header for CSV).
+    """
+    if table not in EXPORT_TABLES:
+        raise ValueError(f"Unknown export table: {table}")
+
+    # Stream from an on-disk snapshot: reading the live DB would hold one read
+    # transaction open across every upload, blocking WAL checkpoints meanwhile.
+    fd, snapshot_path = tempfile.mkstemp(suffix=".db")
+    os.close(fd)
+    conn = sqlite3.connect(snapshot_path, check_same_thread=False)
+    try:
+        src = sqlite3.connect(DB_FILE, timeout=30)
+        try:
+            src.backup(conn)
+        finally:
+            src.close()
+        # the copy inherits WAL mode; drop it so no -wal/-shm files are left behind
+        conn.execute("PRAGMA journal_mode=DELETE;")
+
+        c = conn.cursor()
+        c.execute(f"SELECT * FROM {table}")
+        columns = [d[0] for d in c.description]
+        header = _encode_export_rows(columns, [columns], fmt) if fmt == "csv" else b""
+
+        comp, part = _new_export_part(header)
+        if len(part) + EXPORT_GZIP_TRAILER_BYTES > max_bytes:
+            raise ValueError("Upload limit is too small for the export header")
+        rows_in_part = 0
+        while True:
+            rows = c.fetchmany(EXPORT_CHUNK_ROWS)
+            if not rows:
+                break
+            pending = [rows]
+            while pending:
+                batch = pending.pop()
+                trial = comp.copy()
+                out = trial.compress(_encode_export_rows(columns, batch, fmt)) + trial.flush(zlib.Z_SYNC_FLUSH)
+                if len(part) + len(out) + EXPORT_GZIP_TRAILER_BYTES <= max_bytes:
+                    comp = trial
+                    part += out
+                    rows_in_part += len(batch)
+                elif rows_in_part:
+                    # current part is full: ship it and retry this batch in a fresh one
+                    yield bytes(part + comp.flush()), rows_in_part
+                    comp, part = _new_export_part(header)
+                    rows_in_part = 0
+                    pending.append(batch)
+                elif len(batch) > 1:
+                    mid = len(batch) // 2
+                    pending.append(batch[mid:])
+                    pending.append(batch[:mid])
+                else:
+                    raise ValueError("A single row is larger than the upload limit")
+
+        yield bytes(part + comp.flush()), rows_in_part
+    finally:
+        conn.close()
+        os.remove(snapshot_path)
+
 # ================= CORE LOGIC (sync + calc) =================
 def seed_default_tax_rules():
     conn = sqlite3.connect(DB_FILE)
@@ -650,6 +741,74 @@ async def set_ae_tax(interaction: discord.Interaction, amount: float):
 
 
 
+@bot.tree.command(name="export", description="(Admin) Export tax data as compressed CSV / JSON Lines")
+@app_commands.describe(table="Table to export", fmt="Output format")
+@app_commands.choices(
+    table=[app_commands.Choice(name=t, value=t) for t in EXPORT_TABLES],
+    fmt=[
+        app_commands.Choice(name="CSV", value="csv"),
+        app_commands.Choice(name="JSON Lines", value="jsonl"),
+    ]
+)
+async def export(interaction: discord.Interaction, table: str = "players", fmt: str = "csv"):
+
+    if not interaction.user.guild_permissions.administrator:
+        await interaction.response.send_message("❌ Admins only.", ephemeral=True)
+        return
+
+    await interaction.response.defer(ephemeral=True)
+
+    limit = interaction.guild.filesize_limit if interaction.guild else EXPORT_DEFAULT_UPLOAD_LIMIT
+    week_tag = get_tax_week_start().strftime("%Y%m%d")
+    parts = iter_export_parts(table, fmt, limit)
+
+    batch = []
+    batch_bytes = 0
+    part_no = 0
+    delivered = 0
+    total_rows = 0
+    step = None
+    try:
+        while True:
+            # pull parts in a thread so compression never blocks the event loop;
+            # shielded so a cancelled export still lets the thread finish (see finally)
+            step = asyncio.ensure_future(asyncio.to_thread(next, parts, None))
+            item = await asyncio.shield(step)
+            if item is None:
+                break
+            data, n_rows = item
+            # keep each message under the upload limit as a whole, not just per file
+            if batch and (batch_bytes + len(data) > limit or len(batch) == EXPORT_MAX_FILES_PER_MESSAGE):
+                await interaction.followup.send(files=batch, ephemeral=True)
+                delivered += len(batch)
+                batch, batch_bytes = [], 0
+            part_no += 1
+            total_rows += n_rows
+            filename = f"{table}_week{week_tag}_part{part_no:03d}.{fmt}.gz"
+            batch.append(discord.File(io.BytesIO(data), filename=filename))
+            batch_bytes += len(data)
+        if batch:
+            await interaction.followup.send(files=batch, ephemeral=True)
+            delivered += len(batch)
+    except (sqlite3.Error, ValueError, discord.HTTPException) as e:
+        await interaction.followup.send(
+            f"⚠️ Export failed: {e}\n📦 Delivered {delivered} part(s) before the error.",
+            ephemeral=True
+        )
+        return
+    finally:
+        # close() raises if next() is still running in its thread, so wait for it first
+        if step is not None and not step.done():
+            await asyncio.wait({step})
+        parts.close()
+
+    await interaction.followup.send(
+        f"✅ Exported **{total_rows}** rows from `{table}` in **{part_no}** file(s) (tax week of {week_tag}).",
+        ephemeral=True
+    )
+
+
+
 # ================= START BOT =================
 if __name__ == "__main__":
     init_db()